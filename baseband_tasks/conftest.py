@@ -16,8 +16,8 @@ else:
         # packages for which version numbers are displayed when running the
         # tests inside the python interpreter.
         PYTEST_HEADER_MODULES.clear()
-        for pkg in ('baseband', 'astropy', 'numpy', 'pyfftw', 'pint',
-                    'h5py', 'yaml'):
+        for pkg in ('baseband', 'astropy', 'numpy', 'pyfftw', 'scipy',
+                    'pint', 'h5py', 'yaml'):
             PYTEST_HEADER_MODULES[pkg] = pkg
 
         try:
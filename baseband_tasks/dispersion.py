@@ -119,9 +119,12 @@ class Disperse(PaddedTaskBase):
         if self._sample_offset != 0:
             phase_delay += (self._sample_offset / self.sample_rate * u.cycle
                             * self._fft.frequency)
-        phase_factor = np.exp(phase_delay.to_value(u.rad) * 1j)
-        phase_factor = phase_factor.astype(self._fft.frequency_dtype,
-                                           copy=False)
+        # Calculate exp(1j * phase) directly in the output array, to avoid
+        # creating double-precision complex temporaries.
+        phase = phase_delay.to_value(u.rad)
+        phase_factor = np.empty(phase.shape, self._fft.frequency_dtype)
+        np.cos(phase, out=phase_factor.real)
+        np.sin(phase, out=phase_factor.imag)
         return phase_factor
 
     @property
@@ -22,6 +22,12 @@ a given direction, etc.
 from .base import fft_maker
 from .numpy import NumpyFFTMaker
 
+# If scipy is available, import ScipyFFTMaker (but do not make it default).
+try:
+    from .scipy import ScipyFFTMaker  # noqa
+except ImportError:
+    pass
+
 # If pyfftw is available, import PyfftwFFTMaker.
 try:
     from .pyfftw import PyfftwFFTMaker
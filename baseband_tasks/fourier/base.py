@@ -423,7 +423,7 @@ class fft_maker(ScienceState):
 
         Parameters
         ----------
-        fft_engine : {'numpy', 'pyfftw'}, FFTMaker instance, or `None`
+        fft_engine : {'numpy', 'scipy', 'pyfftw'}, FFTMaker instance, or `None`
             Keyword identifying the FFT maker class to create, or an FFT
             maker instance.  If `None`, the engine stored in the
             ``system_default`` attribute is used.
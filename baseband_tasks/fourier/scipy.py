@@ -0,0 +1,114 @@
+# Licensed under the GPLv3 - see LICENSE
+"""FFT maker and class using the `scipy.fft` routines."""
+
+from scipy import fft as scipy_fft
+
+from .base import FFTMakerBase, FFTBase
+
+
+__all__ = ['ScipyFFTBase', 'ScipyFFTMaker']
+
+
+class ScipyFFTBase(FFTBase):
+    """Single pre-defined FFT based on `scipy.fft`.
+
+    To use, initialize an instance, then call the instance to perform
+    the transform.
+
+    Parameters
+    ----------
+    direction : 'forward' or 'backward', optional
+        Direction of the FFT.
+    """
+
+    def __init__(self, direction='forward'):
+        super().__init__(direction=direction)
+        time_complex = self._time_dtype.kind == 'c'
+        if self.direction == 'forward':
+            self._fft = self._cfft if time_complex else self._rfft
+        else:
+            self._fft = self._icfft if time_complex else self._irfft
+
+    def _cfft(self, a):
+        return scipy_fft.fft(a, axis=self.axis, norm=self._norm,
+                             workers=self._workers).astype(
+                                 self._frequency_dtype, copy=False)
+
+    def _icfft(self, a):
+        return scipy_fft.ifft(a, axis=self.axis, norm=self._norm,
+                              workers=self._workers).astype(
+                                  self._time_dtype, copy=False)
+
+    def _rfft(self, a):
+        return scipy_fft.rfft(a, axis=self.axis, norm=self._norm,
+                              workers=self._workers).astype(
+                                  self._frequency_dtype, copy=False)
+
+    # irfft needs explicit length for odd-numbered outputs.
+    def _irfft(self, a):
+        return scipy_fft.irfft(a, axis=self.axis, norm=self._norm,
+                               n=self._time_shape[self.axis],
+                               workers=self._workers).astype(
+                                   self._time_dtype, copy=False)
+
+
+class ScipyFFTMaker(FFTMakerBase):
+    """FFT factory class utilizing `scipy.fft` functions.
+
+    FFTs of real-valued time-domain data use `~scipy.fft.rfft` and its inverse.
+    Unlike `numpy.fft`, `scipy.fft` preserves single precision and can
+    distribute a transform over multiple threads.
+
+    ``__init__`` is used to set package-level options, such as ``workers``,
+    while `~baseband_tasks.fourier.scipy.ScipyFFTMaker.__call__` creates
+    individual transforms.
+
+    Parameters
+    ----------
+    workers : int or None, optional
+        Maximum number of threads to use.  If negative, counts back from
+        the number of CPUs (i.e., -1 uses all).  If `None`, uses the
+        `scipy.fft` default (which is 1, unless changed with
+        `scipy.fft.set_workers`).
+    """
+    _FFTBase = ScipyFFTBase
+
+    def __init__(self, workers=None):
+        self._workers = workers
+        super().__init__()
+
+    def __call__(self, shape, dtype, direction='forward', axis=0, ortho=False,
+                 sample_rate=None):
+        """Creates an FFT.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the time-domain data array, i.e. the input to the forward
+            transform and the output of the inverse.
+        dtype : str or `~numpy.dtype`
+            Data type of the time-domain data array.  May pass either the
+            name of the dtype or the `~numpy.dtype` object.
+        direction : 'forward' or 'backward', optional
+            Direction of the FFT.
+        axis : int, optional
+            Axis to transform.  Default: 0.
+        ortho : bool, optional
+            Whether to use orthogonal normalization.  Default: `False`.
+        sample_rate : float, `~astropy.units.Quantity`, or None, optional
+            Sample rate, used to determine the FFT sample frequencies.  If
+            `None`, a unitless rate of 1 is used.
+
+        Returns
+        -------
+        fft : ``ScipyFFT`` instance
+            Single pre-defined FFT object.
+        """
+        return super().__call__(
+            shape=shape, dtype=dtype, direction=direction,
+            axis=axis, ortho=ortho, sample_rate=sample_rate,
+            norm=('ortho' if ortho else None), workers=self._workers)
+
+    def __repr__(self):
+        self._repr_kwargs = dict(workers=self._workers)
+        return super().__repr__()
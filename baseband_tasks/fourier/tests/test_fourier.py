@@ -234,3 +234,27 @@ class TestPyfftwFFT:
         y1 = fft1(x.copy())
         y2 = fft2(x.copy())
         assert np.allclose(y1, y2 / np.sqrt(16))
+
+
+@pytest.mark.skipif('scipy' not in FFT_MAKER_CLASSES,
+                    reason="Test is SciPy specific")
+class TestScipyFFT:
+    def setup(self):
+        self.maker = FFT_MAKER_CLASSES['scipy']
+
+    @pytest.mark.parametrize('workers', (None, 1, -1))
+    def test_workers(self, workers):
+        maker = self.maker(workers=workers)
+        assert repr(maker) == 'ScipyFFTMaker(workers={})'.format(workers)
+        x = np.exp(1.j * 2. * np.pi * np.linspace(0., 10., 1024))
+        fft = maker((1024, 2), 'complex64')
+        assert fft._workers == workers
+        ifft = fft.inverse()
+        assert ifft._workers == workers
+        y = np.stack([x, x[::-1]], axis=1).astype('complex64')
+        Y = fft(y)
+        assert Y.dtype == np.complex64
+        assert np.allclose(Y, np.fft.fft(y, axis=0), atol=1e-3, rtol=1e-5)
+        y_back = ifft(Y)
+        assert y_back.dtype == np.complex64
+        assert np.allclose(y_back, y, atol=1e-6, rtol=1e-5)